@@ -126,3 +126,59 @@ def test_accesskey_already_in_text():
     """Test that we can combine if the accesskey is already in the text."""
     assert accesskey.combine("Mail & Newsgroups", "N") == "Mail & &Newsgroups"
     assert accesskey.extract("Mail & &Newsgroups") == ("Mail & Newsgroups", "N")
+
+
+def test_match_entities():
+    """Test that label and accesskey entities are paired up."""
+    mixer = accesskey.UnitMixer((".label", ".title"), (".accesskey", ".akey"))
+    index = {
+        "file.label": None,
+        "file.accesskey": None,
+        "edit.title": None,
+        "edit.akey": None,
+        "view.label": None,
+        "help.accesskey": None,
+    }
+    mixedentities = mixer.match_entities(index)
+    assert sorted(mixedentities) == [
+        "edit.akey",
+        "edit.title",
+        "file.accesskey",
+        "file.label",
+    ]
+    # Each entity gets its own bucket dict
+    assert mixedentities["file.label"] is not mixedentities["file.accesskey"]
+
+
+def test_match_entities_several_accesskeys():
+    """Test that a label is paired with every accesskey sharing its base."""
+    mixer = accesskey.UnitMixer((".label",), (".accesskey", ".akey"))
+    index = {"c.label": None, "c.accesskey": None, "c.akey": None}
+    mixedentities = mixer.match_entities(index)
+    assert sorted(mixedentities) == ["c.accesskey", "c.akey", "c.label"]
+
+
+def test_find_mixed_pair_overlapping_suffixes():
+    """Test that every label suffix an entity ends with is tried."""
+
+    class Unit:
+        def __init__(self, entity):
+            self.entity = entity
+
+        def getid(self):
+            return self.entity
+
+    class Store:
+        id_index = {"b.label": None, "bkey": None}
+
+    mixer = accesskey.UnitMixer(("label", ".label"), ("key",))
+    mixedentities = mixer.match_entities(Store.id_index)
+    assert sorted(mixedentities) == ["b.label", "bkey"]
+    assert mixer.find_mixed_pair(mixedentities, Store, Unit("b.label")) == (
+        "b.label",
+        "bkey",
+    )
+    assert mixer.find_mixed_pair(mixedentities, Store, Unit("bkey")) == (
+        "b.label",
+        "bkey",
+    )
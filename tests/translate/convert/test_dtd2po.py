@@ -227,6 +227,17 @@ class TestDTD2PO:
                 assert pounit.source == "&Save As..."
                 assert pounit.target == "&Gcina ka..."
 
+    def test_accesskeys_several_per_label(self):
+        """Test that every accesskey sharing a label's base is folded into it."""
+        dtdsource = (
+            '<!ENTITY c.label "Copy">\n'
+            '<!ENTITY c.accesskey "C">\n'
+            '<!ENTITY c.akey "o">\n'
+        )
+        pofile = self.dtd2po(dtdsource)
+        sources = [unit.source for unit in pofile.units if not unit.isheader()]
+        assert sources == ["&Copy", "C&opy"]
+
     def test_accesskeys_mismatch(self):
         """Check that we can handle accesskeys that don't match and thus can't be folded into the .label entry."""
         dtdsource = (
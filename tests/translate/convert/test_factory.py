@@ -0,0 +1,39 @@
+import pytest
+
+from translate.convert import factory
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(factory, "converters", {})
+
+
+def dummy_convert(inputfile, outputfile, templatefile):
+    return True
+
+
+def test_get_extension():
+    assert factory.get_extension("file.po") == "po"
+    assert factory.get_extension("dir/file.tar.gz") == "gz"
+    assert factory.get_extension("file") is None
+
+
+def test_output_extensions(registry):
+    assert factory.get_output_extensions("po") == []
+    factory.converters["po"] = [("xlf", dummy_convert)]
+    factory.converters["po", "html"] = [("html", dummy_convert)]
+    factory.converters["html",] = [("po", dummy_convert)]
+    assert factory.get_output_extensions("po") == ["xlf", "html"]
+    assert factory.get_output_extensions("html") == ["po"]
+
+
+def test_get_converter(registry):
+    factory.converters["po"] = [("xlf", dummy_convert)]
+    factory.converters["html",] = [("po", dummy_convert)]
+    assert factory.get_converter("po") is dummy_convert
+    assert factory.get_converter("po", "xlf") is dummy_convert
+    assert factory.get_converter("html") is dummy_convert
+    with pytest.raises(factory.UnsupportedConversionError):
+        factory.get_converter("po", "html")
+    with pytest.raises(factory.UnsupportedConversionError):
+        factory.get_converter("po", templ_ext="html")
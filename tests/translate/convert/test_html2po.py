@@ -394,6 +394,33 @@ newlines.</p></body></html>
         self.compareunit(pofile, 2, "Duplicate")
         assert pofile.units[2].getlocations() == ["None+html.body.p:1-42"]
 
+    def test_duplicates_merge(self):
+        """Check that duplicate messages are merged into the first one."""
+        markup = (
+            "<html><head></head><body><p>Duplicate</p><p>Other</p>"
+            "<p>Duplicate</p></body></html>"
+        )
+        pofile = self.html2po(markup, duplicatestyle="merge")
+        self.countunits(pofile, 2)
+        self.compareunit(pofile, 1, "Duplicate")
+        assert pofile.units[1].getlocations() == [
+            "None+html.body.p:1-26",
+            "None+html.body.p:1-54",
+        ]
+        self.compareunit(pofile, 2, "Other")
+
+    def test_duplicates_keep(self):
+        """Check that duplicate messages are left alone with the keep style."""
+        markup = (
+            "<html><head></head><body><p>Duplicate</p><p>Duplicate</p></body></html>"
+        )
+        pofile = self.html2po(markup, duplicatestyle="keep")
+        self.countunits(pofile, 2)
+        self.compareunit(pofile, 1, "Duplicate")
+        self.compareunit(pofile, 2, "Duplicate")
+        assert not pofile.units[1].getcontext()
+        assert not pofile.units[2].getcontext()
+
     def test_multiline_reflow(self):
         """Check that we reflow multiline content to make it more readable for translators."""
         self.check_single(
@@ -701,3 +728,15 @@ class TestHTML2POCommand(test_convert.TestConvertCommand, TestHTML2PO):
         assert "coming through" in content
         assert "cannot hear" in content
         assert err == ""
+
+    def test_multifile_onefile_duplicates(self):
+        """Test that --multifile=onefile merges duplicates across all input files."""
+        self.create_testfile("file1.html", "<div>Same text</div>")
+        self.create_testfile("file2.html", "<div>Same text</div>")
+        self.run_command(
+            "./", "one.pot", pot=True, multifile="onefile", duplicates="merge"
+        )
+        content = self.read_testfile("one.pot").decode()
+        assert content.count('msgid "Same text"') == 1
+        assert "file1.html" in content
+        assert "file2.html" in content
@@ -128,6 +128,27 @@ msgstr "Two"
         # ...except for a trailing EOL for VCS
         expected = """<?xml version='1.0' encoding='UTF-8'?>
 <root><str key="one">One</str><str key="two">Two</str></root>
+"""
+        assert actual == expected
+
+    def test_duplicate_sources(self):
+        """Test that units sharing a source end up in a single element."""
+        postring = """msgid "one"
+msgstr "One"
+
+msgid "two"
+msgstr "Two"
+
+msgctxt "other"
+msgid "two"
+msgstr "Deux"
+"""
+        actual = self._convert_to_string(postring)
+        expected = """<?xml version='1.0' encoding='UTF-8'?>
+<root>
+  <str key="one">One</str>
+  <str key="two">Deux</str>
+</root>
 """
         assert actual == expected
 
@@ -18,6 +18,8 @@
 
 """Tests for the HTML classes."""
 
+from io import BytesIO
+
 from pytest import raises
 
 from translate.storage import base, html
@@ -40,6 +42,27 @@ def test_guess_encoding():
     )
 
 
+def test_iter_units():
+    """Units are the same whether parsed at once or in small chunks."""
+    markup = (
+        b"<html><head><title>Title</title></head><body>"
+        b'<p>First <b>bold</b> paragraph</p><img alt="Picture">'
+        b"<div>Some\n  wrapped  text</div></body></html>"
+    )
+    expected = [
+        (unit.source, unit.getlocations())
+        for unit in html.htmlfile(inputfile=BytesIO(markup)).units
+    ]
+    assert [unit.source for unit in html.iter_units(BytesIO(markup))] == [
+        "Title",
+        "First <b>bold</b> paragraph",
+        "Picture",
+        "Some wrapped text",
+    ]
+    chunked = html.iter_units(BytesIO(markup), chunksize=7)
+    assert [(unit.source, unit.getlocations()) for unit in chunked] == expected
+
+
 class TestHTMLParsing:
     h = html.htmlfile
 
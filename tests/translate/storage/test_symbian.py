@@ -0,0 +1,80 @@
+"""Tests for the Symbian localisation file helpers."""
+
+from io import BytesIO
+
+import pytest
+
+from translate.convert import po2symb, symb2po
+from translate.storage import po, symbian
+
+R01 = b"""// Generated file
+/*
+Name : Example
+Author : Someone
+*/
+CHARACTER_SET UTF8
+
+// DO NOT TRANSLATE
+rls_string r_string_languagegroup_name "Afrikaans"
+// DO NOT TRANSLATE
+
+rls_string r_hello "Hello \\"World\\""
+rls_string r_bye   "Bye"
+"""
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def r01(request):
+    return R01.replace(b"\n", request.param.encode())
+
+
+def test_read_charset():
+    """Read the charset from the raw byte lines."""
+    lines = BytesIO(R01).readlines()
+    assert symbian.read_charset(lines) == "UTF8"
+    assert symbian.read_charset([b"CHARACTER_SET cp1252\r\n"]) == "cp1252"
+    assert symbian.read_charset([b"// no charset\n"]) == "UTF-8"
+
+
+def test_parse_state():
+    """Decode lines and step through them."""
+    ps = symbian.ParseState(iter([b"one\n", "twö\n".encode()]), "utf-8")
+    assert ps.current_line == "one\n"
+    assert ps.read_line() == "one\n"
+    assert ps.current_line == "twö\n"
+    with pytest.raises(StopIteration):
+        ps.read_line()
+
+
+def test_read_header_item():
+    """Find the first header item or the end of the comment."""
+    ps = symbian.ParseState(iter([b"/*\n", b"Name : Value\n"]), "utf-8")
+    match = symbian.read_header_item(ps)
+    assert match.group("key") == "Name"
+    assert match.group("value") == "Value"
+    ps = symbian.ParseState(iter([b"/*\n", b"no header\n", b"*/\n"]), "utf-8")
+    assert symbian.read_header_item(ps) is None
+    assert ps.current_line == "*/\n"
+
+
+def test_read_symbian(r01):
+    """Parse the header and the translatable strings."""
+    header, units = symb2po.read_symbian(BytesIO(r01))
+    assert header == {"Name": "Example", "Author": "Someone"}
+    assert units == [("r_hello", 'Hello "World"'), ("r_bye", "Bye")]
+
+
+def test_write_symbian(r01):
+    """Replace header items and strings, keeping everything else."""
+    unit = po.pounit("Bye")
+    unit.target = "Totsiens"
+    output = b"".join(
+        po2symb.write_symbian(BytesIO(r01), {"Author": "Vertaler"}, {"r_bye": unit})
+    )
+    expected = r01.replace(b"Author : Someone", b"Author : Vertaler").replace(
+        b'"Bye"', b'"Totsiens"'
+    )
+    assert output == expected
+    header, units = symb2po.read_symbian(BytesIO(output))
+    assert header["Author"] == "Vertaler"
+    assert units[-1] == ("r_bye", "Totsiens")
@@ -23,11 +23,36 @@ and must be preserved during translation while remaining meaningful
 in the target language.
 """
 
+import re
+from functools import lru_cache
+
 from translate.storage.placeables.general import XMLEntityPlaceable
 
 # Default marker for access keys in UI strings
 DEFAULT_ACCESSKEY_MARKER = "&"
 
+# Entity-like runs in a label, from "&" up to the next ";" or space. The
+# access key is only looked for in the text between them.
+_ENTITY_RUNS = re.compile(r"&[^; ]*")
+
+
+@lru_cache(maxsize=8)
+def _get_scanner(accesskey_marker):
+    """
+    Return a compiled regex finding access key candidates for a marker.
+
+    Matches with a ``accesskey`` group are a marker followed by a candidate
+    access key. The lookahead leaves the key unconsumed so "&&x" sees both
+    markers. For "&" the XML entities are matched too, without the group,
+    so that they are skipped.
+    """
+    candidate = re.escape(accesskey_marker) + r"(?=(?P<accesskey>[^ ]))"
+    if accesskey_marker == "&":
+        return re.compile(
+            XMLEntityPlaceable.regex.pattern + "|" + candidate, re.VERBOSE
+        )
+    return re.compile(candidate)
+
 
 class UnitMixer:
     """
@@ -56,6 +81,9 @@ class UnitMixer:
         """
         self.labelsuffixes = labelsuffixes
         self.accesskeysuffixes = accesskeysuffixes
+        # str.endswith() needs a tuple to check all suffixes in one call
+        self._label_tuple = tuple(labelsuffixes)
+        self._akey_tuple = tuple(accesskeysuffixes)
 
     def match_entities(self, index):
         """
@@ -73,19 +101,34 @@ class UnitMixer:
         """
         #: Entities which have a .label/.title and .accesskey combined
         mixedentities = {}
+        label_tuple = self._label_tuple
+        akey_tuple = self._akey_tuple
+        # Group entity base names by suffix in one pass, pairs are then
+        # found by intersecting the label and accesskey groups
+        label_bases = {labelsuffix: set() for labelsuffix in label_tuple}
+        akey_bases = {akeytype: set() for akeytype in akey_tuple}
         for entity in index:
-            for labelsuffix in self.labelsuffixes:
-                if entity.endswith(labelsuffix):
-                    entitybase = entity[: entity.rfind(labelsuffix)]
-                    # see if there is a matching accesskey in this line,
-                    # making this a mixed entity
-                    for akeytype in self.accesskeysuffixes:
-                        if (entitybase + akeytype) in index:
-                            # add both versions to the list of mixed entities
-                            mixedentities[entity] = {}
-                            mixedentities[entitybase + akeytype] = {}
-                    # check if this could be a mixed entity (labelsuffix and
-                    # ".accesskey")
+            if entity.endswith(label_tuple):
+                for labelsuffix in label_tuple:
+                    if entity.endswith(labelsuffix):
+                        label_bases[labelsuffix].add(
+                            entity[: -len(labelsuffix)] if labelsuffix else entity
+                        )
+            if entity.endswith(akey_tuple):
+                for akeytype in akey_tuple:
+                    if entity.endswith(akeytype):
+                        akey_bases[akeytype].add(
+                            entity[: -len(akeytype)] if akeytype else entity
+                        )
+        for labelsuffix, bases in label_bases.items():
+            if not bases:
+                continue
+            # a label is mixed with every accesskey type sharing its base
+            for akeytype in akey_tuple:
+                for entitybase in bases & akey_bases[akeytype]:
+                    # add both versions to the list of mixed entities
+                    mixedentities.setdefault(entitybase + labelsuffix, {})
+                    mixedentities.setdefault(entitybase + akeytype, {})
         return mixedentities
 
     @staticmethod
@@ -109,11 +152,9 @@ class UnitMixer:
         """
         target_unit.addlocations(label_unit.getlocations())
         target_unit.addlocations(accesskey_unit.getlocations())
-        target_unit.msgidcomment = (
-            target_unit._extract_msgidcomments() + label_unit._extract_msgidcomments()
-        )
         target_unit.msgidcomment = (
             target_unit._extract_msgidcomments()
+            + label_unit._extract_msgidcomments()
             + accesskey_unit._extract_msgidcomments()
         )
         target_unit.addnote(label_unit.getnotes("developer"), "developer")
@@ -152,27 +193,30 @@ class UnitMixer:
 
         # depending on what we come across first, work out the label
         # and the accesskey
+        label_tuple = self._label_tuple
+        akey_tuple = self._akey_tuple
+        id_index = store.id_index
         labelentity, accesskeyentity = None, None
-        for labelsuffix in self.labelsuffixes:
-            if entity.endswith(labelsuffix):
-                entitybase = entity[: entity.rfind(labelsuffix)]
-                for akeytype in self.accesskeysuffixes:
-                    if (entitybase + akeytype) in store.id_index:
+        if entity.endswith(label_tuple):
+            # try every label suffix the entity ends with, the last pair
+            # found wins
+            for labelsuffix in label_tuple:
+                if not entity.endswith(labelsuffix):
+                    continue
+                entitybase = entity[: -len(labelsuffix)] if labelsuffix else entity
+                for akeytype in akey_tuple:
+                    if (entitybase + akeytype) in id_index:
                         labelentity = entity
-                        accesskeyentity = (
-                            labelentity[: labelentity.rfind(labelsuffix)] + akeytype
-                        )
+                        accesskeyentity = entitybase + akeytype
                         break
-        if labelentity is None:
-            for akeytype in self.accesskeysuffixes:
+        if labelentity is None and entity.endswith(akey_tuple):
+            for akeytype in akey_tuple:
                 if entity.endswith(akeytype):
                     accesskeyentity = entity
-                    for labelsuffix in self.labelsuffixes:
-                        labelentity = (
-                            accesskeyentity[: accesskeyentity.rfind(akeytype)]
-                            + labelsuffix
-                        )
-                        if labelentity in store.id_index:
+                    entitybase = entity[: -len(akeytype)] if akeytype else entity
+                    for labelsuffix in label_tuple:
+                        labelentity = entitybase + labelsuffix
+                        if labelentity in id_index:
                             break
                     else:
                         labelentity = None
@@ -206,25 +250,14 @@ def extract(string, accesskey_marker=DEFAULT_ACCESSKEY_MARKER):
     assert len(accesskey_marker) == 1
     if not string:
         return "", ""
-    accesskey = ""
-    label = string
-    marker_pos = 0
-    while marker_pos >= 0:
-        marker_pos = string.find(accesskey_marker, marker_pos)
-        if marker_pos != -1:
-            marker_pos += 1
-            if marker_pos == len(string):
-                break
-            if accesskey_marker == "&" and XMLEntityPlaceable.regex.match(
-                string[marker_pos - 1 :]
-            ):
-                continue
-            # FIXME This is weak filtering, we should have a richer set of
-            # invalid accesskeys, not just space.
-            if string[marker_pos] != " ":
-                label = string[: marker_pos - 1] + string[marker_pos:]
-                accesskey = string[marker_pos]
-    return label, accesskey
+    # The last valid marker wins
+    marker_pos = -1
+    for match in _get_scanner(accesskey_marker).finditer(string):
+        if match.group("accesskey") is not None:
+            marker_pos = match.start()
+    if marker_pos == -1:
+        return string, ""
+    return string[:marker_pos] + string[marker_pos + 1 :], string[marker_pos + 1]
 
 
 def combine(label, accesskey, accesskey_marker=DEFAULT_ACCESSKEY_MARKER):
@@ -253,32 +286,42 @@ def combine(label, accesskey, accesskey_marker=DEFAULT_ACCESSKEY_MARKER):
     assert isinstance(label, str)
     assert isinstance(accesskey, str)
 
-    if len(accesskey) == 0:
+    # A multi-character accesskey can never match a single label character
+    if len(accesskey) != 1:
         return None
 
-    searchpos = 0
     accesskeypos = -1
-    in_entity = False
     accesskeyaltcasepos = -1
 
     accesskey_alt_case = accesskey.lower() if accesskey.isupper() else accesskey.upper()
+    if len(accesskey_alt_case) != 1:
+        # e.g. "ß".upper() == "SS", which no single character matches
+        accesskey_alt_case = accesskey
+
+    if accesskey not in label and accesskey_alt_case not in label:
+        # can't currently mix accesskey if it's not in label
+        return None
+
+    if "&" not in label:
+        # No entities to skip, so the first occurrence is the one we want
+        accesskeypos = label.find(accesskey)
+        if accesskeypos == -1:
+            accesskeypos = label.find(accesskey_alt_case)
+        return label[:accesskeypos] + accesskey_marker + label[accesskeypos:]
 
-    while (accesskeypos < 0) and searchpos < len(label):
-        searchchar = label[searchpos]
-        if searchchar == "&":
-            in_entity = True
-        elif searchchar in {";", " "}:
-            in_entity = False
-        if not in_entity:
-            if searchchar == accesskey:  # Prefer supplied case
-                accesskeypos = searchpos
-            elif searchchar == accesskey_alt_case:  # Other case otherwise
-                if accesskeyaltcasepos == -1:
-                    # only want to remember first altcasepos
-                    accesskeyaltcasepos = searchpos
-                    # note: we keep on looping through in hope
-                    # of exact match
-        searchpos += 1
+    entity_spans = [entity.span() for entity in _ENTITY_RUNS.finditer(label)]
+    entity_spans.append((len(label), len(label)))
+    start = 0
+    for end, next_start in entity_spans:
+        pos = label.find(accesskey, start, end)
+        if pos != -1:  # Prefer supplied case
+            accesskeypos = pos
+            break
+        if accesskeyaltcasepos == -1:  # Other case otherwise
+            # only want to remember first altcasepos, but we keep on looking
+            # in hope of an exact match
+            accesskeyaltcasepos = label.find(accesskey_alt_case, start, end)
+        start = next_start
 
     # if we didn't find an exact case match, use an alternate one if available
     if accesskeypos == -1:
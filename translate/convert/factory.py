@@ -42,6 +42,7 @@ Usage:
 """
 
 import os
+import tempfile
 
 # Global registry of available converters
 converters = {}
@@ -103,9 +104,11 @@ def get_extension(filename):
     Returns:
         Extension without leading dot, or None if no extension
     """
-    path, fname = os.path.split(filename)
-    ext = fname.split(os.extsep)[-1]
-    if ext == fname:
+    fname = os.path.basename(filename)
+    # Unlike os.path.splitext(), this also treats ".bashrc" as having an
+    # extension, as the toolkit always has
+    base, sep, ext = fname.rpartition(os.extsep)
+    if not sep:
         return None
     return ext
 
@@ -269,8 +272,6 @@ def convert(inputfile, template=None, options=None, convert_options=None):
     #      issues when being closed (and deleted) by the rest of the toolkit
     #      (eg. TranslationStore.savefile()). Therefore none of mkstemp()'s
     #      security features are being utilised.
-    import tempfile
-
     tempfd, tempfname = tempfile.mkstemp(
         prefix="ttk_convert", suffix=os.extsep + out_ext
     )
@@ -118,8 +118,10 @@ class flatxml2po:
         2. Convert each unit to PO format
         3. Add converted units to target store
         """
+        convert_unit = self.convert_unit
+        addunit = self.target_store.addunit
         for source_unit in self.source_store.units:
-            self.target_store.addunit(self.convert_unit(source_unit))
+            addunit(convert_unit(source_unit))
 
     def run(self):
         """
@@ -127,14 +129,18 @@ class flatxml2po:
         
         Process:
         1. Convert the XML store to PO
-        2. Check if result is empty
-        3. Serialize output if not empty
+        2. Release the parsed XML document
+        3. Check if result is empty
+        4. Serialize output if not empty
         
         Returns:
             1 if conversion successful and not empty
             0 if resulting PO file would be empty
         """
         self.convert_store()
+        # The PO units hold no references into the XML tree, so drop it
+        # before serializing instead of keeping both documents alive
+        self.source_store = None
 
         if self.target_store.isempty():
             return 0
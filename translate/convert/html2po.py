@@ -72,41 +72,64 @@ class html2po:
             duplicatestyle: How to handle duplicate strings:
                 - 'msgctxt': Use message context
                 - 'merge': Combine units
-                - 'keep': Keep duplicates
+                - 'keep': Keep duplicates, skipping the deduplication
+                  pass altogether
             keepcomments: Whether to preserve HTML comments
             
         Returns:
             A pofile object containing the extracted strings
         """
         thetargetfile = po.pofile()
-        self.convertfile_inner(inputfile, thetargetfile, keepcomments)
-        thetargetfile.removeduplicates(duplicatestyle)
+        has_duplicates = self.convertfile_inner(
+            inputfile, thetargetfile, keepcomments, duplicatestyle
+        )
+        if has_duplicates and duplicatestyle != "keep":
+            thetargetfile.removeduplicates(duplicatestyle)
         return thetargetfile
 
     @staticmethod
-    def convertfile_inner(inputfile, outputstore, keepcomments):
+    def convertfile_inner(inputfile, outputstore, keepcomments, duplicatestyle="keep"):
         """
         Extract translation units from HTML and add to PO store.
         
         Process:
-        1. Parse HTML using htmlfile parser
-        2. Extract translatable units
+        1. Parse HTML incrementally using html.iter_units
+        2. Extract translatable units as they are found
         3. Create PO units with:
            - Source text
            - Locations (HTML elements/attributes)
            - Developer notes (from HTML comments)
+        4. Merge duplicates into the first unit when duplicatestyle
+           is 'merge'
         
         Args:
             inputfile: HTML file to process
             outputstore: PO store to add units to
             keepcomments: Whether to preserve HTML comments
+            duplicatestyle: 'merge' to merge duplicates while adding
+                units, anything else adds every unit
+        
+        Returns:
+            Whether units with duplicate sources were added to the store
         """
-        htmlparser = html.htmlfile(inputfile=inputfile)
-        for htmlunit in htmlparser.units:
-            thepo = outputstore.addsourceunit(htmlunit.source)
+        #: First unit added for each source text
+        seen = {}
+        has_duplicates = False
+        for htmlunit in html.iter_units(inputfile):
+            thepo = outputstore.UnitClass(htmlunit.source)
             thepo.addlocations(htmlunit.getlocations())
             if keepcomments:
                 thepo.addnote(htmlunit.getnotes(), "developer")
+            origpo = seen.get(htmlunit.source)
+            if origpo is None:
+                seen[htmlunit.source] = thepo
+            elif duplicatestyle == "merge":
+                origpo.merge(thepo)
+                continue
+            else:
+                has_duplicates = True
+            outputstore.addunit(thepo)
+        return has_duplicates
 
 
 def converthtml(
@@ -212,7 +235,8 @@ class Html2POOptionParser(convert.ConvertOptionParser):
         
         Handles two modes:
         1. Single file: Direct conversion to output
-        2. Multi-file: Add to combined output store
+        2. Multi-file: Add to combined output store, keeping duplicates
+           for recursiveprocess to resolve once all files are read
         
         Args:
             inputfile: HTML file to convert
@@ -225,7 +249,9 @@ class Html2POOptionParser(convert.ConvertOptionParser):
         """
         convertor = html2po()
         if hasattr(self, "outputstore"):
-            convertor.convertfile_inner(inputfile, self.outputstore, keepcomments)
+            convertor.convertfile_inner(
+                inputfile, self.outputstore, keepcomments, duplicatestyle="keep"
+            )
         else:
             outputstore = convertor.convertfile(
                 inputfile,
@@ -241,7 +267,8 @@ class Html2POOptionParser(convert.ConvertOptionParser):
         Process HTML files in directory trees.
         
         Modes:
-        1. onefile: Combine all HTML into single PO
+        1. onefile: Combine all HTML into single PO, removing duplicates
+           in a single pass over the combined store
         2. individual: Create PO file for each HTML
         
         Args:
@@ -251,7 +278,8 @@ class Html2POOptionParser(convert.ConvertOptionParser):
             self.outputstore = po.pofile()
             super().recursiveprocess(options)
             if not self.outputstore.isempty():
-                self.outputstore.removeduplicates(options.duplicatestyle)
+                if options.duplicatestyle != "keep":
+                    self.outputstore.removeduplicates(options.duplicatestyle)
                 outputfile = super().openoutputfile(options, options.output)
                 self.outputstore.serialize(outputfile)
                 if options.output:
@@ -45,33 +45,28 @@ def applytranslation(entity, dtdunit, inputunit, mixedentities):
     if len(unquotedstr.strip()) == 0:
         return
     # handle mixed entities
-    for labelsuffix in dtd.labelsuffixes:
-        if entity.endswith(labelsuffix):
-            if entity in mixedentities:
-                unquotedstr, akey = accesskey.extract(unquotedstr)
-                break
-    else:
-        for akeytype in dtd.accesskeysuffixes:
-            if entity.endswith(akeytype):
-                if entity in mixedentities:
-                    label, unquotedstr = accesskey.extract(unquotedstr)
-                    if not unquotedstr:
-                        warnings.warn(f"Could not find accesskey for {entity}")
-                        # Use the source language accesskey
-                        label, unquotedstr = accesskey.extract(inputunit.source)
-                    else:
-                        original = dtdunit.source
-                        # For the sake of diffs we keep the case of the
-                        # accesskey the same if we know the translation didn't
-                        # change. Casing matters in XUL.
-                        if (
-                            unquotedstr == dtdunit.source
-                            and original.lower() == unquotedstr.lower()
-                        ):
-                            if original.isupper():
-                                unquotedstr = unquotedstr.upper()
-                            elif original.islower():
-                                unquotedstr = unquotedstr.lower()
+    if entity in mixedentities:
+        if entity.endswith(dtd.labelsuffixes):
+            unquotedstr, akey = accesskey.extract(unquotedstr)
+        elif entity.endswith(dtd.accesskeysuffixes):
+            label, unquotedstr = accesskey.extract(unquotedstr)
+            if not unquotedstr:
+                warnings.warn(f"Could not find accesskey for {entity}")
+                # Use the source language accesskey
+                label, unquotedstr = accesskey.extract(inputunit.source)
+            else:
+                original = dtdunit.source
+                # For the sake of diffs we keep the case of the
+                # accesskey the same if we know the translation didn't
+                # change. Casing matters in XUL.
+                if (
+                    unquotedstr == dtdunit.source
+                    and original.lower() == unquotedstr.lower()
+                ):
+                    if original.isupper():
+                        unquotedstr = unquotedstr.upper()
+                    elif original.islower():
+                        unquotedstr = unquotedstr.lower()
     dtdunit.source = unquotedstr
 
 
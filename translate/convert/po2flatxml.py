@@ -45,6 +45,8 @@ For detailed usage instructions and examples, see:
 http://docs.translatehouse.org/projects/translate-toolkit/en/latest/commands/flatxml2po.html
 """
 
+from functools import partial
+
 from translate.convert import convert
 from translate.storage import flatxml, po
 
@@ -108,6 +110,15 @@ class po2flatxml:
         if indent > 0:
             indent_chars = " " * indent
 
+        # Every converted unit shares these settings, bind them once
+        self._make_unit = partial(
+            self.TargetUnitClass,
+            source=None,
+            namespace=ns,
+            element_name=value,
+            attribute_name=key,
+        )
+
         self.source_store = po.pofile(inputfile)
         self.target_store = self.TargetStoreClass(
             templatefile,
@@ -133,14 +144,9 @@ class po2flatxml:
         Returns:
             XML unit containing the translated string
         """
-        target_unit = self.TargetUnitClass(
-            source=None,
-            namespace=self.namespace,
-            element_name=self.value_name,
-            attribute_name=self.key_name,
-        )
+        target_unit = self._make_unit()
         target_unit.source = unit.source
-        if unit.istranslated() or not bool(unit.source):
+        if unit.istranslated() or not unit.source:
             target_unit.target = unit.target
         else:
             target_unit.target = unit.source
@@ -157,14 +163,20 @@ class po2flatxml:
         4. Create new XML units if needed
         5. Apply translations or fall back to source
         """
+        # findid() relies on the store index, which addunit() does not
+        # update, so keep our own index of the units added so far
+        index = {
+            target_unit.getid(): target_unit for target_unit in self.target_store.units
+        }
         for unit in self.source_store.units:
             key = unit.source
             if not key:
                 continue
-            target_unit = self.target_store.findid(key)
+            target_unit = index.get(key)
             if target_unit is None:
                 target_unit = self.convert_unit(unit)
                 self.target_store.addunit(target_unit)
+                index[key] = target_unit
             else:
                 target_unit.target = unit.target
 
@@ -174,14 +186,18 @@ class po2flatxml:
         
         Process:
         1. Convert the PO store to XML
-        2. Check if result is empty
-        3. Serialize output if not empty
+        2. Release the parsed PO file
+        3. Check if result is empty
+        4. Serialize output if not empty
         
         Returns:
             1 if conversion successful and not empty
             0 if resulting XML file would be empty
         """
         self.convert_store()
+        # The XML units copy the strings they need, so drop the PO store
+        # before serializing instead of keeping both documents alive
+        self.source_store = None
 
         if self.target_store.isempty():
             return 0
@@ -29,10 +29,9 @@ from translate.storage.pypo import po_escape_map
 from translate.storage.symbian import (
     ParseState,
     eat_whitespace,
-    header_item_or_end_re,
     header_item_re,
     read_charset,
-    read_while,
+    read_header_item,
     skip_no_translate,
     string_entry_re,
 )
@@ -44,16 +43,20 @@ def escape(text):
     return f'"{text}"'
 
 
+def line_ending(line):
+    return "\r\n" if line.endswith("\r\n") else "\n"
+
+
 def replace_header_items(ps, replacments):
-    match = read_while(ps, header_item_or_end_re.match, lambda match: match is None)
+    read_header_item(ps)
     while not ps.current_line.startswith("*/"):
         match = header_item_re.match(ps.current_line)
         if match is not None:
             key = match.groupdict()["key"]
             if key in replacments:
                 ps.current_line = match.expand(
-                    f"\\g<key>\\g<space>{replacments[key]}\n"
-                )
+                    f"\\g<key>\\g<space>{replacments[key]}"
+                ) + line_ending(ps.current_line)
         ps.read_line()
 
 
@@ -71,8 +74,8 @@ def parse(ps, header_replacements, body_replacements):
                         body_replacements[key].target or body_replacements[key].source
                     )
                     ps.current_line = match.expand(
-                        f"\\g<start>\\g<id>\\g<space>{escape(value)}\n"
-                    )
+                        f"\\g<start>\\g<id>\\g<space>{escape(value)}"
+                    ) + line_ending(ps.current_line)
             ps.read_line()
     except StopIteration:
         pass
@@ -28,19 +28,18 @@ from translate.storage.pypo import unescape
 from translate.storage.symbian import (
     ParseState,
     eat_whitespace,
-    header_item_or_end_re,
     header_item_re,
-    identity,
     read_charset,
-    read_while,
+    read_header_item,
+    read_while_line,
     skip_no_translate,
     string_entry_re,
 )
 
 
 def read_header_items(ps):
-    match = read_while(ps, header_item_or_end_re.match, lambda match: match is None)
-    if match.groupdict()["end_comment"] is not None:
+    match = read_header_item(ps)
+    if match is None:
         return {}
 
     results = {}
@@ -50,7 +49,7 @@ def read_header_items(ps):
         results[match_chunks["key"]] = match_chunks["value"]
         match = header_item_re.match(ps.current_line)
 
-    match = read_while(ps, identity, lambda line: not line.startswith("*/"))
+    read_while_line(ps, lambda line: not line.startswith("*/"))
     ps.read_line()
     return results
 
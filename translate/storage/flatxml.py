@@ -37,12 +37,16 @@ class FlatXMLUnit(base.TranslationUnit):
         namespace=None,
         element_name=None,
         attribute_name=None,
+        xmlelement=None,
         **kwargs,
     ):
         self.namespace = namespace or self.DEFAULT_NAMESPACE
         self.element_name = element_name or self.DEFAULT_ELEMENT_NAME
         self.attribute_name = attribute_name or self.DEFAULT_ATTRIBUTE_NAME
-        self.xmlelement = etree.Element(self.namespaced(self.element_name))
+        if xmlelement is not None:
+            self.xmlelement = xmlelement
+        else:
+            self.xmlelement = etree.Element(self.namespaced(self.element_name))
         super().__init__(source, **kwargs)
 
     def __str__(self):
@@ -97,14 +101,13 @@ class FlatXMLUnit(base.TranslationUnit):
             return None
         if element.tag != namespaced(namespace, element_name):
             return None
-        unit = cls(
+        return cls(
             source=None,
             namespace=namespace,
             element_name=element_name,
             attribute_name=attribute_name,
+            xmlelement=element,
         )
-        unit.xmlelement = element
-        return unit
 
 
 class NOTPROVIDED:
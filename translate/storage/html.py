@@ -495,3 +495,23 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
 
 class POHTMLParser(htmlfile):
     pass
+
+
+def iter_units(inputfile, chunksize=32768):
+    """
+    Parse an HTML file and yield its translation units as they are found.
+
+    Unlike :class:`htmlfile`, neither the units nor the rebuilt document are
+    kept around, which is all that extracting the units needs. The whole file
+    is still read up front, as the charset may be declared anywhere in it.
+    """
+    parser = htmlfile()
+    parser.filename = getattr(inputfile, "name", None)
+    htmlsrc = inputfile.read()
+    inputfile.close()
+    htmlsrc = parser.do_encoding(htmlsrc)
+    for start in range(0, len(htmlsrc), chunksize):
+        parser.feed(htmlsrc[start : start + chunksize])
+        yield from parser.units
+        parser.units = []
+        parser.filesrc = ""
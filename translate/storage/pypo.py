@@ -1004,7 +1004,9 @@ class pofile(pocommon.pofile):
                 yield unit
 
     def addunit(self, unit):
-        needs_update = unit.wrapper != self.wrapper
+        # Units created without a wrapper were quoted with a default one, they
+        # only need quoting again when this store wraps differently
+        needs_update = (unit.wrapper or PoWrapper()) != self.wrapper
         unit.wrapper = self.wrapper
         super().addunit(unit)
         if needs_update:
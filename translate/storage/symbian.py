@@ -16,15 +16,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+import io
 import re
 
-charset_re = re.compile(r"CHARACTER_SET[ ]+(?P<charset>.*)")
-header_item_or_end_re = re.compile(
-    r"(((?P<key>[^ ]+)(?P<space>[ ]*:[ ]*)(?P<value>.*))|(?P<end_comment>[*]/))"
-)
-header_item_re = re.compile(r"(?P<key>[^ ]+)(?P<space>[ ]*:[ ]*)(?P<value>.*)")
+# Matched against the raw bytes, the charset is needed to decode the file
+charset_re = re.compile(rb"CHARACTER_SET[ ]+(?P<charset>.*)")
+# Values stop before the line ending, "\r" included for CRLF files
+header_item_re = re.compile(r"(?P<key>[^ ]+)(?P<space>[ ]*:[ ]*)(?P<value>[^\r\n]*)")
 string_entry_re = re.compile(
-    r"(?P<start>rls_string[ ]+)(?P<id>[^ ]+)(?P<space>[ ]+)(?P<str>.*)"
+    r"(?P<start>rls_string[ ]+)(?P<id>[^ ]+)(?P<space>[ ]+)(?P<str>[^\r\n]*)"
 )
 
 
@@ -34,7 +34,9 @@ def identity(x):
 
 class ParseState:
     def __init__(self, f, charset, read_hook=identity):
-        self.f = f
+        # Decode the whole input at once rather than line by line. Lines are
+        # split on "\n" only, as iterating over the bytes did.
+        self.f = io.StringIO(b"".join(f).decode(charset), newline="\n")
         self.charset = charset
         self.current_line = ""
         self.read_hook = read_hook
@@ -43,7 +45,7 @@ class ParseState:
     def read_line(self):
         current_line = self.current_line
         self.read_hook(current_line)
-        self.current_line = next(self.f).decode(self.charset)
+        self.current_line = next(self.f)
         return current_line
 
 
@@ -55,23 +57,48 @@ def read_while(ps, f, test):
     return result
 
 
+def read_while_line(ps, test):
+    read_line = ps.read_line
+    while test(ps.current_line):
+        read_line()
+
+
+def read_header_item(ps):
+    """
+    Skip to the first header item, returning its match.
+
+    Returns None if the end of the header comment comes first.
+    """
+    return read_while(
+        ps,
+        header_item_re.match,
+        lambda match: match is None and not ps.current_line.startswith("*/"),
+    )
+
+
 def eat_whitespace(ps):
-    read_while(ps, identity, lambda line: line.strip())
+    read_line = ps.read_line
+    # Skip blank lines, isspace() avoids building a stripped copy
+    while not ps.current_line or ps.current_line.isspace():
+        read_line()
 
 
 def skip_no_translate(ps):
     if ps.current_line.startswith("// DO NOT TRANSLATE"):
-        ps.read_line()
-        read_while(
-            ps, identity, lambda line: not line.startswith("// DO NOT TRANSLATE")
-        )
-        ps.read_line()
+        read_line = ps.read_line
+        read_line()
+        while not ps.current_line.startswith("// DO NOT TRANSLATE"):
+            read_line()
+        read_line()
         eat_whitespace(ps)
 
 
 def read_charset(lines):
     for line in lines:
+        # Cheap substring test first, most lines are not the charset line
+        if b"CHARACTER_SET" not in line:
+            continue
         match = charset_re.match(line)
         if match is not None:
-            return match.groupdict()["charset"]
+            return match.group("charset").strip().decode("ascii")
     return "UTF-8"